@@ -1,23 +1,42 @@
 import logging
+import logging.handlers
+import queue
 import sys
 import pytest
 
+# Background listener writing queued log records to stdout
+_log_listener = None
+
 # Configure pytest
 @pytest.hookimpl
 def pytest_configure(config):
     """Configure pytest logging and custom markers."""
-    # Configure logging
+    global _log_listener
+
+    # Configure logging; records are written to stdout by a background thread
+    log_queue = queue.Queue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.StreamHandler(sys.stdout),
+            queue_handler,
         ]
     )
+    # basicConfig does nothing if the root logger was already configured, in which case nothing writes to the queue
+    if queue_handler in logging.getLogger().handlers:
+        _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+        _log_listener.start()
 
     # Configure custom markers
     config.addinivalue_line("markers", "archive: mark test to run only on specific archives")
 
+@pytest.hookimpl
+def pytest_unconfigure(config):
+    """Write out any queued log records and stop the background listener."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
 # Add command line options
 @pytest.hookimpl
 def pytest_addoption(parser):
@@ -39,15 +58,13 @@ def pytest_collection_modifyitems(config, items):
 
     for item in items:
         # Check if the test is parametrized with an archive
-        if hasattr(item, 'callspec') and hasattr(item.callspec, 'params') and 'archive' in item.callspec.params:
-            archive = item.callspec.params['archive']
-            if archive.name == archive_name:
-                selected.append(item)
-            else:
-                deselected.append(item)
-        else:
-            # Keep non-archive tests
+        callspec = getattr(item, 'callspec', None)
+        archive = callspec.params.get('archive') if callspec is not None else None
+        if archive is None or archive.name == archive_name:
+            # Keep non-archive tests and tests for the selected archive
             selected.append(item)
+        else:
+            deselected.append(item)
 
     config.hook.pytest_deselected(items=deselected)
     items[:] = selected
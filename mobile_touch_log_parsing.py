@@ -1,7 +1,15 @@
+import atexit
+import bisect
+import concurrent.futures
 import datetime
 import enum
+import functools
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import re
 import sys
 import time
 from pathlib import Path
@@ -9,30 +17,54 @@ from typing import Callable, List
 from threading import Event
 
 import mobiletouch_tools
-from mobiletouch_tools import kill_mobiletouch_process
 
 # Import win11toast for notifications
 try:
     from win11toast import notify
     NOTIFICATIONS_AVAILABLE = True
 except ImportError:
+    # logged below, once logging has been configured
     NOTIFICATIONS_AVAILABLE = False
-    logging.warning("win11toast not available. Notifications will be disabled.")
+
+# Import watchdog for filesystem change notifications
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    # logged below, once logging has been configured
+    WATCHDOG_AVAILABLE = False
 
 # Global variable to track the last notification time
 _last_notification_time = datetime.datetime.min
 _last_callback_time = datetime.datetime.min
 
+# Log records are handed to a background thread through a queue, so that the thread parsing the
+# log file doesn't block on writing to stdout
+_log_queue = queue.Queue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
 logging.basicConfig(
     level=logging.DEBUG,  # Set to logging.DEBUG for more verbose output
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout),
+        _log_queue_handler,
     ]
 )
+# basicConfig does nothing if the root logger was already configured, in which case nothing writes to the queue
+_log_listener = None
+if _log_queue_handler in logging.getLogger().handlers:
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    # Write out any queued records before the process exits
+    atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-# Path to the standard log file. If this path doesn't exist, the program will use a linear falloff
+if not NOTIFICATIONS_AVAILABLE:
+    logger.warning("win11toast not available. Notifications will be disabled.")
+if not WATCHDOG_AVAILABLE:
+    logger.warning("watchdog not available. The log file will be polled for changes.")
+
+# Path to the standard log file. If this path doesn't exist, the program will use an exponential backoff
 # mechanism to retry with increasing delays.
 standard_log_path = Path(r"C:\ProgramData\Physio-Control\MobileTouch\logging\mobiletouch.log")
 
@@ -71,22 +103,9 @@ class TriggerString(enum.Enum):
 
     def __init__(self, value):
         self._value_ = value
-        self._callback = None
-
-    @property
-    def callback(self):
-        """Get the callback function for this trigger string."""
-        return self._callback
-
-    @callback.setter
-    def callback(self, func: Callable[['LogEntry', Path], None]):
-        """
-        Set a callback function to be called when this trigger string is detected.
-
-        Args:
-            func: A function that takes a LogEntry and Path as arguments and returns None.
-        """
-        self._callback = func
+        # Function called when this trigger string is detected, takes a LogEntry and Path and returns None.
+        # A plain attribute rather than a property, as it is read for every trigger hit.
+        self.callback: Callable[['LogEntry', Path], None] = None
 
     @staticmethod
     def from_message(message: str):
@@ -94,12 +113,32 @@ class TriggerString(enum.Enum):
         Returns the TriggerString that matches the given message.
         :return: TriggerString if found, otherwise UNKNOWN.
         """
-        for trigger in TriggerString:
-            if trigger.name in message:
-                return trigger
-        logger.debug(f"No matching trigger string found for message: {message}")
+        trigger = match_trigger(message)
+        if trigger is not None:
+            return trigger
+        logger.debug("No matching trigger string found for message: %s", message)
         return TriggerString.UNKNOWN
 
+# A single pattern matching any trigger string, so each message is scanned once instead of once per trigger.
+# UNKNOWN is only a placeholder for unmatched messages and is left out.
+TRIGGER_RE = re.compile('|'.join(re.escape(trigger.value) for trigger in TriggerString
+                                  if trigger is not TriggerString.UNKNOWN))
+_TRIGGERS_BY_VALUE = {trigger.value: trigger for trigger in TriggerString}
+# TRIGGER_RE for raw bytes read from the log file, to find trigger lines before decoding or parsing anything
+TRIGGER_BYTES_RE = re.compile(TRIGGER_RE.pattern.encode('utf-8'))
+
+def match_trigger(message: str):
+    """
+    Finds the trigger string contained in a message.
+    Used by both TriggerString.from_message and check_trigger_strings so that they always agree.
+    :param message: The log message to search
+    :return: the matching TriggerString, or None if the message contains none
+    """
+    match = TRIGGER_RE.search(message)
+    if match is None:
+        return None
+    return _TRIGGERS_BY_VALUE[match.group()]
+
 class LogLevel(enum.Enum):
     """
     Enumeration of log levels used in the MobileTouch log file.
@@ -120,38 +159,177 @@ class LogLevel(enum.Enum):
         :param level: The log level as a string.
         :return: LogLevel if found, otherwise INFO.
         """
-        try:
-            if level == 'SEVERE':
-                return LogLevel.ERROR
-
-            return LogLevel[level.upper()]
-        except KeyError:
-            logger.warning(f"Invalid log level '{level}', defaulting to INFO.")
+        log_level = _LOG_LEVELS_BY_NAME.get(level)
+        if log_level is None:
+            # mixed case names are rare enough to only be normalized here
+            log_level = _LOG_LEVELS_BY_NAME.get(level.upper())
+        if log_level is None:
+            logger.warning("Invalid log level '%s', defaulting to INFO.", level)
             return LogLevel.INFO
+        return log_level
 
     def __str__(self):
         return self._value_
 
 
+# Maps the level names found in the log file to LogLevel members; the Chrome console uses SEVERE for errors.
+# Lowercase names are included so that lookups never need to call upper().
+_LOG_LEVELS_BY_NAME = {name: level for name, level in LogLevel.__members__.items()}
+_LOG_LEVELS_BY_NAME['SEVERE'] = LogLevel.ERROR
+_LOG_LEVELS_BY_NAME.update({name.lower(): level for name, level in _LOG_LEVELS_BY_NAME.items()})
+
+
+# Matches a timestamp as written to the log file, e.g. "2025-05-26 09:33:40,383"
+TIMESTAMP_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2}),(\d{1,6})')
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_timestamp(timestamp: str) -> datetime.datetime:
+    """
+    Parses a log file timestamp, equivalent to strptime with '%Y-%m-%d %H:%M:%S,%f' but without
+    strptime's per-call format handling.
+    Results are cached, since bursts of entries are often logged with the same timestamp.
+    :param timestamp: The timestamp string
+    :return: datetime object
+    :raises ValueError: If the string isn't a valid timestamp
+    """
+    match = TIMESTAMP_RE.fullmatch(timestamp)
+    if match is None:
+        raise ValueError(f"Invalid timestamp format: {timestamp}")
+    year, month, day, hour, minute, second, fraction = match.groups()
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                             int(fraction.ljust(6, '0')))
+
+
 class LogEntry:
     """
     Represents a single log entry.
     """
 
+    # a log can hold many thousands of entries, so skip the per-instance __dict__
+    __slots__ = ('timestamp', 'level', 'message')
+
     # init from a line in the log file
 
     def __init__(self, timestamp: str, level: str, message: str) -> None:
         # convert string to datetime
         try:
-            self.timestamp = datetime.datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S,%f')
+            self.timestamp = parse_timestamp(timestamp)
         except ValueError as e:
             # print(f"Error parsing timestamp '{timestamp}': {e}", file=sys.stderr)
             raise ValueError(f"Invalid timestamp format: {timestamp}")
-        self.level = LogLevel.from_string(level) if level else LogLevel.INFO
+        if not level:
+            self.level = LogLevel.INFO
+        else:
+            self.level = _LOG_LEVELS_BY_NAME.get(level)
+            if self.level is None:
+                self.level = LogLevel.from_string(level)
         self.message = message
 
+    @classmethod
+    def from_parts(cls, timestamp: datetime.datetime, level: LogLevel, message: str) -> 'LogEntry':
+        """
+        Creates a LogEntry from already parsed parts, skipping the strptime call in __init__.
+        :param timestamp: The timestamp of the entry
+        :param level: The log level of the entry
+        :param message: The message of the entry
+        :return: LogEntry object
+        """
+        entry = cls.__new__(cls)
+        entry.timestamp = timestamp
+        entry.level = level
+        entry.message = message
+        return entry
+
     def __str__(self):
-        return f"{datetime.datetime.strftime(self.timestamp, '%Y-%m-%d %H:%M:%S,%f')[:-3]} {self.level} {self.message}"
+        # same output as strftime('%Y-%m-%d %H:%M:%S,%f')[:-3], formatted from the fields directly
+        t = self.timestamp
+        return (f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d},"
+                f"{t.microsecond // 1000:03d} {self.level} {self.message}")
+
+
+class LogBatch:
+    """
+    A batch of log entries stored as parallel lists of timestamps, levels and messages,
+    rather than one LogEntry object per entry.
+    Entries are expected in chronological order (as they are written to the log file), which lets
+    time-based filtering binary search the timestamps instead of checking every entry.
+    """
+
+    __slots__ = ('timestamps', 'levels', 'messages')
+
+    def __init__(self, timestamps: List[datetime.datetime]=None, levels: List[LogLevel]=None,
+                 messages: List[str]=None) -> None:
+        self.timestamps = timestamps if timestamps is not None else []
+        self.levels = levels if levels is not None else []
+        self.messages = messages if messages is not None else []
+
+    @classmethod
+    def from_entries(cls, log_entries: List[LogEntry]) -> 'LogBatch':
+        """
+        Creates a LogBatch from a list of LogEntry objects in chronological order.
+        :param log_entries: List of log entries
+        :return: LogBatch object
+        """
+        return cls([entry.timestamp for entry in log_entries],
+                   [entry.level for entry in log_entries],
+                   [entry.message for entry in log_entries])
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LogBatch(self.timestamps[index], self.levels[index], self.messages[index])
+        return LogEntry.from_parts(self.timestamps[index], self.levels[index], self.messages[index])
+
+    def __iter__(self):
+        for timestamp, level, message in zip(self.timestamps, self.levels, self.messages):
+            yield LogEntry.from_parts(timestamp, level, message)
+
+    def since(self, cutoff_date: datetime.datetime) -> 'LogBatch':
+        """
+        Returns the entries at or after the cutoff date, found by binary search.
+        :param cutoff_date: The earliest timestamp to keep
+        :return: LogBatch with the remaining entries
+        """
+        return self[bisect.bisect_left(self.timestamps, cutoff_date):]
+
+    def extend(self, other: 'LogBatch') -> None:
+        """
+        Appends the entries of another batch, which should follow this one chronologically.
+        :param other: LogBatch to append
+        """
+        self.timestamps.extend(other.timestamps)
+        self.levels.extend(other.levels)
+        self.messages.extend(other.messages)
+
+
+# Matches a full log line, e.g. "2025-05-26 09:33:40,383 INFO JS API: getNativeVersion returned: 2023.2.208"
+LINE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2}),(\d{3}) (\S+) (.*)')
+
+# Same as LINE_RE, but finds every log line in a whole file's contents at once
+BULK_LINE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2}),(\d{3}) (\S+) ([^\r\n]*)', re.MULTILINE)
+
+
+def _log_entry_from_match(match: re.Match) -> LogEntry:
+    """
+    Builds a LogEntry from a match of LINE_RE or BULK_LINE_RE.
+    :param match: The regex match
+    :return: LogEntry object
+    :raises ValueError: If the timestamp isn't a valid date and time
+    """
+    year, month, day, hour, minute, second, millisecond, level, message = match.groups()
+    try:
+        timestamp = datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                                      int(millisecond) * 1000)
+    except ValueError:
+        raise ValueError(f"Invalid timestamp format: {match.group()[:23]}")
+
+    log_level = _LOG_LEVELS_BY_NAME.get(level)
+    if log_level is None:
+        log_level = LogLevel.from_string(level)
+    return LogEntry.from_parts(timestamp, log_level, message)
 
 
 def log_entry_from_line(line: str):
@@ -163,13 +341,10 @@ def log_entry_from_line(line: str):
     :param line: A single line from the log file
     :return: log_entry object
     """
-    parts = line.split(' ', 3)
-    if len(parts) < 4:
+    match = LINE_RE.fullmatch(line)
+    if match is None:
         raise ValueError(f"Invalid log entry format: {line}")
-
-    timestamp = f"{parts[0]} {parts[1]}"
-    level, message = parts[2], parts[3]
-    return LogEntry(timestamp, level, message)
+    return _log_entry_from_match(match)
 
 def read_log_file(log_path: Path=standard_log_path):
     """
@@ -179,44 +354,300 @@ def read_log_file(log_path: Path=standard_log_path):
     :return: a list of lines from the log file, or an empty list if the file doesn't exist
     """
     if not log_path.exists():
-        logger.debug(f"Log file does not exist: {log_path}")
+        logger.debug("Log file does not exist: %s", log_path)
         return []
-    lines = []
     try:
-        with log_path.open('r', encoding='utf-8') as file:
-            for line in file:
-                lines.append(line.strip())
+        # split in one pass, splitlines already drops the line endings
+        return log_path.read_text(encoding='utf-8', errors='replace').splitlines()
     except Exception as e:
         logger.error(f"Error reading log file: {e}")
 
-    return lines
+    return []
+
+
+def iter_lines_reverse(log_path: Path=standard_log_path, block_size: int=65536):
+    """
+    Yields the lines of the log file from newest to oldest.
+    The file is read backwards in fixed-size blocks, so a caller that stops early (such as
+    parse_log at its cutoff) never reads or decodes the older part of the file.
+    :param log_path: Path to the log file
+    :param block_size: Number of bytes to read from the file at a time
+    :return: a generator of stripped lines, newest first; nothing if the file doesn't exist
+    """
+    if not log_path.exists():
+        logger.debug("Log file does not exist: %s", log_path)
+        return
+    try:
+        with log_path.open('rb') as file:
+            position = file.seek(0, os.SEEK_END)
+            # partial line carried over from the start of the previous block
+            remainder = b''
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                file.seek(position)
+                lines = (file.read(read_size) + remainder).split(b'\n')
+                remainder = lines[0]
+                for line in reversed(lines[1:]):
+                    line = line.decode('utf-8', errors='replace').strip()
+                    if line:
+                        yield line
+            line = remainder.decode('utf-8', errors='replace').strip()
+            if line:
+                yield line
+    except OSError as e:
+        logger.error(f"Error reading log file: {e}")
 
 
-def parse_log(log_path=standard_log_path) -> List[LogEntry]:
+def recent_log_files(log_path: Path, cutoff_date: datetime.datetime) -> List[Path]:
+    """
+    Returns the log file and its rotated copies (mobiletouch.log.1, mobiletouch.log.2, ...) that were
+    modified at or after the cutoff date, newest first. A file last modified before the cutoff can't
+    contain any newer entries, so it is skipped without being opened.
+    Uses os.scandir, whose entries carry the stat info from the directory listing on Windows.
+    :param log_path: Path to the log file
+    :param cutoff_date: Files last modified before this are skipped
+    :return: List of paths, the log file itself first
+    """
+    cutoff_timestamp = cutoff_date.timestamp()
+    rotated_prefix = log_path.name + '.'
+    log_files = []
+    try:
+        with os.scandir(log_path.parent) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name == log_path.name:
+                    index = 0
+                elif dir_entry.name.startswith(rotated_prefix) and dir_entry.name[len(rotated_prefix):].isdigit():
+                    index = int(dir_entry.name[len(rotated_prefix):])
+                else:
+                    continue
+                try:
+                    if dir_entry.stat().st_mtime >= cutoff_timestamp:
+                        log_files.append((index, Path(dir_entry.path)))
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug("Could not list log directory %s: %s", log_path.parent, e)
+        return []
+
+    return [path for _, path in sorted(log_files)]
+
+
+def parse_log(log_path=standard_log_path, now: datetime.datetime=None) -> List[LogEntry]:
     """
     Example of a standard entry:
     2025-05-26 09:33:40,383 INFO JS API: getNativeVersion returned: 2023.2.208
     Parses the standard log file and extracts relevant information.
 
     Reads log entries from end to beginning, as the most recent entries are at the end.
+    Lines that aren't log entries (such as stack trace continuations) are skipped.
+    If the log file doesn't reach back to the cutoff, reading continues into its rotated copies.
     Returns a list of LogEntry objects in reverse chronological order (newest first).
+    :param log_path: Path to the log file
+    :param now: Current time to measure the cutoff from, so a caller can reuse one value across calls.
+                Defaults to datetime.datetime.now()
     :return: List of LogEntry objects
     """
     log_entries = []
-    lines = read_log_file(log_path)
-    cutoff_date = datetime.datetime.now() - datetime.timedelta(hours=2)
-    for line in reversed(lines):
+    if now is None:
+        now = datetime.datetime.now()
+    cutoff_date = now - datetime.timedelta(hours=2)
+    for path in recent_log_files(log_path, cutoff_date):
+        for line in iter_lines_reverse(path):
+            match = LINE_RE.fullmatch(line)
+            if match is None:
+                # not a log entry, such as a stack trace continuation line
+                continue
+            try:
+                entry = _log_entry_from_match(match)
+                # logger.debug("Processing log entry: %s", entry)
+                if entry.timestamp < cutoff_date:
+                    return log_entries
+                log_entries.append(entry)
+            except ValueError as e:
+                logger.warning("Skipping invalid log entry: %s", e)
+
+    return log_entries
+
+def parse_log_bulk(log_path: Path=standard_log_path, cutoff_date: datetime.datetime=None) -> List[LogEntry]:
+    """
+    Parses every entry in the log file, for offline analysis of the whole file rather than tailing it.
+    Rather than splitting, stripping and matching the file line by line, BULK_LINE_RE is run once over
+    its contents, so finding the lines happens inside the regex engine.
+    Lines that aren't log entries (such as stack trace continuations) are skipped.
+    If a cutoff date is given, older lines are rejected by comparing their timestamp prefix as a string,
+    without building a LogEntry for them.
+    :param log_path: Path to the log file
+    :param cutoff_date: If given, entries older than this are skipped
+    :return: List of LogEntry objects in chronological order, or an empty list if the file doesn't exist
+    """
+    if not log_path.exists():
+        logger.debug("Log file does not exist: %s", log_path)
+        return []
+    try:
+        contents = log_path.read_text(encoding='utf-8', errors='replace')
+    except OSError as e:
+        logger.error(f"Error reading log file: {e}")
+        return []
+
+    # timestamps are zero padded, so comparing them as strings orders them chronologically
+    cutoff_prefix = cutoff_date.strftime('%Y-%m-%d %H:%M:%S,%f')[:23] if cutoff_date is not None else ''
+    return _parse_log_contents(contents, cutoff_prefix)
+
+def _parse_log_contents(contents: str, cutoff_prefix: str='') -> List[LogEntry]:
+    """
+    Parses every log entry in a block of log file contents with BULK_LINE_RE.
+    :param contents: The log file contents
+    :param cutoff_prefix: Lines whose timestamp prefix sorts before this are skipped
+    :return: List of LogEntry objects in chronological order
+    """
+    log_entries = []
+    for match in BULK_LINE_RE.finditer(contents):
+        if contents[match.start():match.start() + 23] < cutoff_prefix:
+            continue
         try:
-            entry = log_entry_from_line(line)
-            # logger.debug(f"Processing log entry: {entry}")
-            if entry.timestamp < cutoff_date:
-                break
-            log_entries.append(entry)
+            log_entries.append(_log_entry_from_match(match))
         except ValueError as e:
-            logger.warning(f"Skipping invalid log entry: {e}")
+            logger.warning("Skipping invalid log entry: %s", e)
 
     return log_entries
 
+def _parse_log_range(log_path: Path, start: int, end: int) -> LogBatch:
+    """
+    Parses the lines of the log file that begin within the byte range [start, end).
+    Runs in a worker process for parse_log_parallel.
+    :param log_path: Path to the log file
+    :param start: First byte of the range
+    :param end: Byte after the last byte of the range
+    :return: LogBatch of the entries in the range
+    """
+    with log_path.open('rb') as file:
+        if start > 0:
+            # skip the rest of a line that began in the previous range
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        if position >= end:
+            return LogBatch()
+        # read to the end of the range, and then to the end of the line straddling it, if any
+        data = file.read(end - position)
+        if not data.endswith(b'\n'):
+            data += file.readline()
+    return LogBatch.from_entries(_parse_log_contents(data.decode('utf-8', errors='replace')))
+
+def parse_log_parallel(log_path: Path=standard_log_path, max_workers: int=None) -> LogBatch:
+    """
+    Parses every entry in the log file by splitting it into byte ranges and parsing them in worker processes.
+    Meant for offline reprocessing of large or archived logs; files under a megabyte, or a single worker,
+    are parsed in this process with parse_log_bulk instead.
+    On Windows, worker processes re-import the caller's main module, so call this from behind an
+    if __name__ == "__main__" guard.
+    :param log_path: Path to the log file
+    :param max_workers: Number of worker processes, defaults to the number of CPUs
+    :return: LogBatch of every entry in chronological order, empty if the file doesn't exist
+    """
+    if not log_path.exists():
+        logger.debug("Log file does not exist: %s", log_path)
+        return LogBatch()
+
+    size = log_path.stat().st_size
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or size < 1024 * 1024:
+        return LogBatch.from_entries(parse_log_bulk(log_path))
+
+    chunk_size = -(-size // workers)
+    starts = range(0, size, chunk_size)
+    ends = [min(start + chunk_size, size) for start in starts]
+
+    log_batch = LogBatch()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for range_batch in executor.map(_parse_log_range, [log_path] * len(starts), starts, ends):
+            log_batch.extend(range_batch)
+
+    return log_batch
+
+def _trigger_lines(data: bytes) -> List[bytes]:
+    """
+    Finds the lines of a block of log file data that contain a trigger string.
+    The raw bytes are searched with TRIGGER_BYTES_RE, so lines without a trigger are never split out,
+    decoded or parsed.
+    :param data: Log file data ending with a newline
+    :return: List of the matching lines, each included once
+    """
+    lines = []
+    position = 0
+    while True:
+        match = TRIGGER_BYTES_RE.search(data, position)
+        if match is None:
+            return lines
+        line_start = data.rfind(b'\n', 0, match.start()) + 1
+        # continue after this line, so a line with several triggers is only returned once
+        position = data.find(b'\n', match.end()) + 1
+        lines.append(data[line_start:position])
+
+def complete_lines_end(log_path: Path, block_size: int=65536) -> int:
+    """
+    Returns the byte offset just after the last complete line of the log file, for tailing it from its current end.
+    A partially written last line is left before the offset, so read_new_entries picks it up once it is complete.
+    The file is searched backwards in blocks, so only its tail is read.
+    :param log_path: Path to the log file
+    :param block_size: Number of bytes to read from the file at a time
+    :return: offset after the last newline, or 0 if the file has no complete line or can't be read
+    """
+    try:
+        with log_path.open('rb') as file:
+            position = file.seek(0, os.SEEK_END)
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                file.seek(position)
+                newline = file.read(read_size).rfind(b'\n')
+                if newline != -1:
+                    return position + newline + 1
+    except OSError as e:
+        logger.error(f"Error reading log file: {e}")
+    return 0
+
+def read_new_entries(log_path: Path, offset: int, only_triggers: bool=False):
+    """
+    Reads the entries appended to the log file since the given byte offset.
+    Only complete lines are consumed, a partially written last line is left for the next call.
+    If the file is smaller than the offset, it has been truncated or rotated and is read from the start.
+    :param log_path: Path to the log file
+    :param offset: Byte offset up to which the log file has already been read
+    :param only_triggers: If True, only the lines containing a trigger string are parsed
+    :return: a tuple of the new LogEntry objects in chronological order and the offset to resume from
+    """
+    try:
+        with log_path.open('rb') as file:
+            size = file.seek(0, os.SEEK_END)
+            if size < offset:
+                logger.info("Log file shrank from %d to %d bytes, reading it from the start.", offset, size)
+                offset = 0
+            file.seek(offset)
+            data = file.read(size - offset)
+    except OSError as e:
+        logger.error(f"Error reading log file: {e}")
+        return [], offset
+
+    end = data.rfind(b'\n') + 1
+    if only_triggers:
+        lines = [line.decode('utf-8', errors='replace') for line in _trigger_lines(data[:end])]
+    else:
+        lines = data[:end].decode('utf-8', errors='replace').splitlines()
+    log_entries = []
+    for line in lines:
+        match = LINE_RE.fullmatch(line.strip())
+        if match is None:
+            # blank, or not a log entry, such as a stack trace continuation line
+            continue
+        try:
+            log_entries.append(_log_entry_from_match(match))
+        except ValueError as e:
+            logger.warning("Skipping invalid log entry: %s", e)
+
+    return log_entries, offset + end
+
 def discard_log_on_condition(log_entries, condition: Callable[[LogEntry], bool]):
     """
     Discards log entries based on a condition.
@@ -226,28 +657,65 @@ def discard_log_on_condition(log_entries, condition: Callable[[LogEntry], bool])
     """
     return [entry for entry in log_entries if not condition(entry)]
 
-def discard_older_than(log_entries, days: int):
+def discard_older_than(log_entries, days: int, now: datetime.datetime=None):
     """
     Discards log entries older than a specified number of days.
-    :param log_entries: List of log entries to filter
+    A LogBatch is filtered by binary search, since its entries are in chronological order.
+    :param log_entries: List of log entries or LogBatch to filter
     :param days: Number of days to keep
-    :return: Filtered list of log entries
+    :param now: Current time to measure the cutoff from. Defaults to datetime.datetime.now()
+    :return: Filtered list of log entries, or a LogBatch if one was given
     """
-    cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
+    if now is None:
+        now = datetime.datetime.now()
+    cutoff_date = now - datetime.timedelta(days=days)
+    if isinstance(log_entries, LogBatch):
+        return log_entries.since(cutoff_date)
     return discard_log_on_condition(log_entries, lambda entry: entry.timestamp < cutoff_date)
 
 
 def check_last_modified(log_file: Path = standard_log_path):
     """
-    Checks the last modified date of the log file
+    Checks the last modified time of the log file
     :param log_file: Path to the log file
-    :return: Last modified datetime or None if file doesn't exist
+    :return: Last modified time in nanoseconds since the epoch (st_mtime_ns) or None if file doesn't exist
     """
-    if not log_file.exists():
+    try:
+        return os.stat(log_file).st_mtime_ns
+    except FileNotFoundError:
         return None
-    last_modified = log_file.stat().st_mtime
-    last_modified_date = datetime.datetime.fromtimestamp(last_modified)
-    return last_modified_date
+
+
+# How often a wait for the log file to change checks whether the loop has been asked to stop, in seconds
+_STOP_CHECK_INTERVAL = 0.25
+
+
+def watch_log_file(log_file: Path, changed_event: Event):
+    """
+    Starts a watchdog observer that sets the given event whenever the log file is written, created or moved.
+    :param log_file: Path to the log file
+    :param changed_event: Event to set when the log file changes
+    :return: the started Observer, or None if watchdog is unavailable or the directory can't be watched
+    """
+    if not WATCHDOG_AVAILABLE:
+        return None
+
+    class LogFileEventHandler(FileSystemEventHandler):
+        def _check(self, event):
+            paths = (event.src_path, getattr(event, 'dest_path', ''))
+            if any(path and Path(os.fsdecode(path)).name == log_file.name for path in paths):
+                changed_event.set()
+
+        on_modified = on_created = on_moved = _check
+
+    observer = Observer()
+    try:
+        observer.schedule(LogFileEventHandler(), str(log_file.parent), recursive=False)
+        observer.start()
+    except Exception as e:
+        logger.warning(f"Could not watch {log_file.parent} for changes, falling back to polling: {e}")
+        return None
+    return observer
 
 
 def notification_callback():
@@ -261,7 +729,7 @@ def notification_callback():
     # This is just to acknowledge the user's action.
 
 
-def send_notification(title, message, trigger_type=None):
+def send_notification(title, message, trigger_type=None, now=None):
     """
     Send a notification using win11toast, but only if enough time has passed since the last notification.
 
@@ -269,6 +737,7 @@ def send_notification(title, message, trigger_type=None):
         title (str): The notification title
         message (str): The notification message
         trigger_type (TriggerString, optional): The type of trigger that caused the notification
+        now (datetime, optional): The current time, if the caller already has it. Defaults to datetime.now()
 
     Returns:
         bool: True if notification was sent, False otherwise
@@ -281,11 +750,11 @@ def send_notification(title, message, trigger_type=None):
         return False
 
     # Check if enough time has passed since the last notification (5 minutes = 300 seconds)
-    current_time = datetime.datetime.now()
+    current_time = now if now is not None else datetime.datetime.now()
     time_since_last = (current_time - _last_notification_time).total_seconds()
 
     if time_since_last < 30:  # seconds
-        logger.info(f"Skipping notification: last one was {time_since_last:.1f} seconds ago (< 30 seconds)")
+        logger.info("Skipping notification: last one was %.1f seconds ago (< 30 seconds)", time_since_last)
         return False
 
     # Send notification with callback
@@ -316,28 +785,30 @@ def check_trigger_strings(entry: LogEntry, mobiletouch_path: Path = standard_log
 
     global _last_callback_time
 
-    for trigger in TriggerString:
-        if trigger.value in entry.message:
+    trigger = match_trigger(entry.message)
+    if trigger is None:
+        return False
 
-            logger.info(f"Detected trigger string {trigger.name}: {entry}")
+    logger.info("Detected trigger string %s: %s", trigger.name, entry)
 
-            if trigger.callback:
+    if trigger.callback:
 
-                # Check if enough time has passed since the last callback
-                if (datetime.datetime.now() - _last_callback_time).total_seconds() < 15:
-                    logger.info(f"Skipping callback for {trigger.name}: last callback was less than 15 seconds ago.")
-                    break
+        # Check if enough time has passed since the last callback
+        now = datetime.datetime.now()
+        if (now - _last_callback_time).total_seconds() < 15:
+            logger.info("Skipping callback for %s: last callback was less than 15 seconds ago.", trigger.name)
+            return False
 
-                # Send notification about the detected error
-                send_notification(
-                    title="MobileTouch Error Detected",
-                    message=f"A {trigger.name} error was detected. The repair service will attempt to fix it.",
-                    trigger_type=trigger
-                )
-                _last_callback_time = datetime.datetime.now()
-                trigger.callback(entry, mobiletouch_path)
-            return True
-    return False
+        # Send notification about the detected error
+        send_notification(
+            title="MobileTouch Error Detected",
+            message=f"A {trigger.name} error was detected. The repair service will attempt to fix it.",
+            trigger_type=trigger,
+            now=now
+        )
+        _last_callback_time = now
+        trigger.callback(entry, mobiletouch_path)
+    return True
 
 
 def register_trigger_callback(trigger: TriggerString, callback: Callable[[LogEntry, Path], None]):
@@ -362,13 +833,65 @@ def register_trigger_callbacks(callbacks: dict):
         register_trigger_callback(trigger, callback)
 
 
+def _sleep_unless_stopped(stop_event: Event, delay: float) -> None:
+    """
+    Sleeps for the given delay, returning early once stop_event is set.
+    :param stop_event: Event that signals the loop to stop, or None to sleep for the whole delay
+    :param delay: Time to sleep in seconds
+    """
+    if stop_event is None:
+        time.sleep(delay)
+    else:
+        stop_event.wait(timeout=delay)
+
+
+def _wait_unless_stopped(stop_event: Event, timeout: float, changed_event: Event) -> bool:
+    """
+    Waits until changed_event is set or the timeout passes, returning early once stop_event is set.
+    stop_event is checked every _STOP_CHECK_INTERVAL seconds, so a stop is noticed promptly even while
+    waiting up to max_delay for the log file to change.
+    :param stop_event: Event that signals the loop to stop, or None
+    :param timeout: Maximum time to wait in seconds
+    :param changed_event: Event to wait for; it is cleared once it has been seen
+    :return: True if changed_event was set, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    while stop_event is None or not stop_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if changed_event.wait(timeout=min(remaining, _STOP_CHECK_INTERVAL)):
+            changed_event.clear()
+            return True
+    return False
+
+
+def retry_delay(consecutive_failures: int, base_delay: float, max_delay: float) -> float:
+    """
+    Calculates how long to wait before retrying after a number of consecutive failures.
+    The delay doubles with each failure up to max_delay, plus up to half a second of jitter.
+    :param consecutive_failures: Number of failures in a row, starting at 1
+    :param base_delay: Delay after the first failure in seconds
+    :param max_delay: Maximum delay in seconds, before jitter
+    :return: delay in seconds
+    """
+    return min(base_delay * 2 ** min(consecutive_failures - 1, 10), max_delay) + random.uniform(0, 0.5)
+
+
 def main_loop(stop_event: Event = None, logs_loaded_event: Event = None,log_file: Path = standard_log_path):
     """
     Main loop for the log parsing script.
     Continuously checks the log file and processes new entries.
+    The file is tailed from a byte offset, so each modification only parses the lines appended since the
+    last check, and of those only the ones containing a trigger string.
+    Entries already in the file when the loop starts are not acted upon.
     Monitors for all defined trigger strings and handles them appropriately.
     Uses threading Event to allow for clean termination of the loop.
-    Implements a linear falloff mechanism for retries when the log file doesn't exist.
+    If watchdog is available, the loop sleeps until the log file is written to (checking anyway every
+    max_delay seconds in case an event was missed) instead of polling it every second.
+    Without watchdog, the file is polled every base_delay seconds after a change, backing off to max_delay
+    while it stays unchanged.
+    Implements an exponential backoff mechanism for retries when the log file doesn't exist.
 
     Args:
         stop_event: Threading Event used to signal the loop to stop
@@ -376,11 +899,14 @@ def main_loop(stop_event: Event = None, logs_loaded_event: Event = None,log_file
         :param log_file:
     """
     # set initial to unix epoch time
-    last_modified = datetime.datetime.fromtimestamp(0)
-    last_seen_log_entry = None
+    last_modified = 0
+    # byte offset up to which the log file has been processed, None until the initial load
+    last_offset = None
     consecutive_failures = 0
     max_delay = 10  # Maximum delay in seconds
+    max_retry_delay = 60  # Maximum delay between retries after failures in seconds
     base_delay = 1   # Base delay in seconds
+    idle_delay = base_delay  # Delay between polls, grows while the log file is unchanged
 
     # validate existence of log file
     if not log_file.exists():
@@ -389,73 +915,91 @@ def main_loop(stop_event: Event = None, logs_loaded_event: Event = None,log_file
 
     mobiletouch_dir_path = log_file.parent.parent
 
-    while stop_event is None or not stop_event.is_set():
-        try:
-            temp_last_modified = check_last_modified(log_file)
-
-            # Handle case where log file doesn't exist
-            if temp_last_modified is None:
-                consecutive_failures += 1
-                # Calculate delay with linear falloff (capped at max_delay)
-                delay = min(base_delay * consecutive_failures, max_delay)
-                logger.info(f"Log file not found. Retrying in {delay} seconds...")
-                time.sleep(delay)
-                continue
-
-            # Reset failure counter if we successfully read the file
-            consecutive_failures = 0
+    log_changed = Event()
+    observer = watch_log_file(log_file, log_changed)
 
-            if temp_last_modified > last_modified:
-                last_modified = temp_last_modified
-                entries = parse_log(log_file)
-
-                if not entries:
-                    logger.info(f"No entries found in the log file: {log_file}")
+    try:
+        while stop_event is None or not stop_event.is_set():
+            try:
+                temp_last_modified = check_last_modified(log_file)
+
+                # Handle case where log file doesn't exist
+                if temp_last_modified is None:
+                    consecutive_failures += 1
+                    # Calculate delay with exponential backoff (capped at max_retry_delay)
+                    delay = retry_delay(consecutive_failures, base_delay, max_retry_delay)
+                    logger.info("Log file not found. Retrying in %.1f seconds...", delay)
+                    if observer is not None:
+                        # Wake early if the log file is created in the meantime
+                        _wait_unless_stopped(stop_event, delay, log_changed)
+                    else:
+                        _sleep_unless_stopped(stop_event, delay)
                     continue
 
-                # initially, the newest entries will be on the end of the list
-                if last_seen_log_entry is None and entries:
-                    last_seen_log_entry = entries[0]  # Get the most recent entry
-                    logger.info("Initial log entries loaded")
-                    # Notify that logs have been loaded
-                    if logs_loaded_event is not None:
-                        logger.info("Logs have been loaded")
-                        logs_loaded_event.set()
-                else:
-                    if last_seen_log_entry is None:
-                        logger.warning("No previous log entry found, cannot compare timestamps.")
-                        last_seen_log_entry = entries[0] if entries else None
-                        continue
-                    logger.info(f"Log file modified at {last_modified}. Old: {last_seen_log_entry.timestamp} Parsing new entries...")
-                    # Check for entries newer than last_seen_log_entry
-                    new_entries = [entry for entry in entries if entry.timestamp >= last_seen_log_entry.timestamp]
-                    if new_entries:
-                        last_seen_log_entry = new_entries[0]  # Update to most recent entry
+                # Reset failure counter if we successfully read the file
+                consecutive_failures = 0
+
+                if temp_last_modified > last_modified:
+                    last_modified = temp_last_modified
+                    idle_delay = base_delay
+
+                    if last_offset is None:
+                        # start tailing after the last complete line, so a line still being written is read once finished
+                        last_offset = complete_lines_end(log_file)
+                        logger.info("Initial log entries loaded")
+                        # Notify that logs have been loaded
+                        if logs_loaded_event is not None:
+                            logger.info("Logs have been loaded")
+                            logs_loaded_event.set()
+                    else:
+                        new_entries, new_offset = read_new_entries(log_file, last_offset, only_triggers=True)
+                        # one summary per modification; entries with a trigger are logged by check_trigger_strings
+                        logger.info("Log file modified at %s. Read %d new bytes from offset %d, %d entries with trigger strings.",
+                                    datetime.datetime.fromtimestamp(last_modified / 1e9), new_offset - last_offset,
+                                    last_offset, len(new_entries))
                         for entry in new_entries:
-                            logger.info(str(entry))
                             check_trigger_strings(entry, mobiletouch_dir_path)
-                    else:
-                        logger.warning("No new entries found since last check despite file modification?")
+                        if new_offset == last_offset:
+                            logger.warning("No new entries found since last check despite file modification?")
+                        last_offset = new_offset
+                else:
+                    # logger.debug("No new entries found.")
+                    idle_delay = min(idle_delay * 1.5, max_delay)
+            except Exception as e:
+                logger.error(f"An error occurred: {e}")
+                consecutive_failures += 1
+                # Calculate delay with exponential backoff (capped at max_retry_delay)
+                delay = retry_delay(consecutive_failures, base_delay, max_retry_delay)
+                _sleep_unless_stopped(stop_event, delay)
             else:
-                # logger.debug("No new entries found.")
-                pass
-        except Exception as e:
-            logger.error(f"An error occurred: {e}")
-            consecutive_failures += 1
-            # Calculate delay with linear falloff (capped at max_delay)
-            delay = min(base_delay * consecutive_failures, max_delay)
-            time.sleep(delay)
-        else:
-            # If no exception occurred, use the base delay
-            time.sleep(base_delay)
+                if observer is not None:
+                    # Wait for the next write to the log file
+                    _wait_unless_stopped(stop_event, max_delay, log_changed)
+                else:
+                    # Poll quickly after a change, backing off up to max_delay while the file stays idle
+                    _sleep_unless_stopped(stop_event, idle_delay)
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 
-def handle_failed_reference_tables(entry: LogEntry=None, file_path: Path=None):
+def _do_repair(entry: LogEntry, file_path: Path, description: str, actions: List[Callable[[Path], None]]):
+    """
+    Runs a repair: closes MobileTouch, runs each repair action on the MobileTouch directory in order,
+    and starts MobileTouch again.
+    Repairs are at least 15 seconds apart (see check_trigger_strings), so the restart is never skipped;
+    skipping it would leave MobileTouch closed.
+    :param entry: LogEntry that caused the repair, or None if the repair was called directly
+    :param file_path: Path to the MobileTouch directory
+    :param description: What the repair does, for the log message
+    :param actions: Functions that take the MobileTouch directory and perform the repair
+    """
     if entry is not None:
-        logger.info(f"ACTION: Clearing reference tables due to: {entry.message}")
-
-    kill_mobiletouch_process()
-    mobiletouch_tools.deleteRefTableStore(file_path)
+        logger.info(f"ACTION: {description} due to: {entry.message}")
+    mobiletouch_tools.kill_mobiletouch_process()
+    for action in actions:
+        action(file_path)
 
     # Start MobileTouch after repair
     logger.info("Starting MobileTouch application after repair...")
@@ -465,47 +1009,24 @@ def handle_failed_reference_tables(entry: LogEntry=None, file_path: Path=None):
         logger.warning("Failed to start MobileTouch application.")
 
 
-def handle_failed_device_info(entry: LogEntry, mobiletouch_path: Path):
-    if entry is not None:
-        logger.info(f"ACTION: Clearing device info, cookies, and service worker due to: {entry.message}")
-    mobiletouch_tools.kill_mobiletouch_process()
-    mobiletouch_tools.delete_deviceinfo_entry(mobiletouch_path)
-    mobiletouch_tools.clear_cookies_and_service_worker(mobiletouch_path)
+def handle_failed_reference_tables(entry: LogEntry=None, file_path: Path=None):
+    _do_repair(entry, file_path, "Clearing reference tables",
+               [mobiletouch_tools.deleteRefTableStore])
 
-    # Start MobileTouch after repair
-    logger.info("Starting MobileTouch application after repair...")
-    if mobiletouch_tools.start_mobiletouch():
-        logger.info("MobileTouch application started successfully.")
-    else:
-        logger.warning("Failed to start MobileTouch application.")
 
+def handle_failed_device_info(entry: LogEntry, mobiletouch_path: Path):
+    _do_repair(entry, mobiletouch_path, "Clearing device info, cookies, and service worker",
+               [mobiletouch_tools.delete_deviceinfo_entry, mobiletouch_tools.clear_cookies_and_service_worker])
 
-def handle_corrupt_schema(entry: LogEntry, file_path: Path):
-    if entry is not None:
-        logger.info(f"ACTION: Performing hard clear (deletion of appdata) due to: {entry.message}")
-    mobiletouch_tools.kill_mobiletouch_process()
-    mobiletouch_tools.hard_clear(file_path)
 
-    # Start MobileTouch after repair
-    logger.info("Starting MobileTouch application after repair...")
-    if mobiletouch_tools.start_mobiletouch():
-        logger.info("MobileTouch application started successfully.")
-    else:
-        logger.warning("Failed to start MobileTouch application.")
+def handle_corrupt_schema(entry: LogEntry, file_path: Path):
+    _do_repair(entry, file_path, "Performing hard clear (deletion of appdata)",
+               [mobiletouch_tools.hard_clear])
 
 
 def handle_stores_not_set_up(entry: LogEntry, file_path: Path):
-    if entry is not None:
-        logger.info(f"ACTION: Performing hard clear (deletion of appdata) due to: {entry.message}")
-    mobiletouch_tools.kill_mobiletouch_process()
-    mobiletouch_tools.hard_clear(file_path)
-
-    # Start MobileTouch after repair
-    logger.info("Starting MobileTouch application after repair...")
-    if mobiletouch_tools.start_mobiletouch():
-        logger.info("MobileTouch application started successfully.")
-    else:
-        logger.warning("Failed to start MobileTouch application.")
+    _do_repair(entry, file_path, "Performing hard clear (deletion of appdata)",
+               [mobiletouch_tools.hard_clear])
 
 
 default_callbacks = {
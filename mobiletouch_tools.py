@@ -1,3 +1,6 @@
+import concurrent.futures
+import contextlib
+import itertools
 import logging
 import os
 import sys
@@ -9,8 +12,17 @@ from shutil import rmtree
 
 # Global variable to store the MobileTouch executable path
 _mobiletouch_executable_path = None
+# time.monotonic() of the last search that didn't find the executable, and how long to trust that result in seconds
+_last_failed_executable_search = None
+_FAILED_EXECUTABLE_SEARCH_TTL = 30
+
+# Snapshot of the running MobileTouch processes, as (time.monotonic() when taken, list of psutil.Process)
+_mobiletouch_processes = (None, [])
+# How long the snapshot is reused for, in seconds
+_PROCESS_SNAPSHOT_TTL = 2
 
 from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -20,101 +32,133 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 standard_path = os.path.dirname("C:\\ProgramData\\Physio-Control\\MobileTouch\\")
 
-def clear_object_store(idb: IndexedDB, object_store_name):
-    idb.driver.execute_script(
-        """
-            console.log("Clearing object store: " + arguments[2]);
-            var [ dbName, dbVersion, objectStoreName] = [ arguments[0], arguments[1], arguments[2]];
+# Chrome for Testing and its driver are bundled next to this module (see update_service.ps1)
+_bundle_dir = os.path.dirname(os.path.abspath(__file__))
+_chrome_binary_path = os.path.join(_bundle_dir, 'chrome-win32', 'chrome.exe')
+_chrome_driver_path = os.path.join(_bundle_dir, 'chromedriver.exe')
+
+# Skip the parts of Chrome's startup that a headless repair session doesn't need
+_chrome_startup_arguments = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--disable-renderer-backgrounding",
+    "--metrics-recording-only",
+    "--mute-audio",
+]
+
+def _run_object_store_script(idb: IndexedDB, script, *args, timeout=30):
+    """
+    Runs an IndexedDB script with execute_async_script, in a single round trip to the browser.
+    The script reports back by calling the callback Selenium appends to its arguments with
+    {ok: true} or {ok: false, error: message}.
+    :param idb: IndexedDB whose driver, name and version are used
+    :param script: The script; arguments[0] and arguments[1] are the database name and version
+    :param args: Further arguments for the script
+    :param timeout: Seconds to wait for the script to report back
+    :return: true if the script reported success, false otherwise
+    """
+    # the driver may belong to the caller, so its script timeout is put back afterwards
+    previous_timeout = idb.driver.timeouts.script
+    idb.driver.set_script_timeout(timeout)
+    try:
+        result = idb.driver.execute_async_script(script, idb.db_name, idb.db_version, *args)
+    except TimeoutException as e:
+        print(f"Timeout waiting for IndexedDB operation to complete: {e}")
+        return False
+    finally:
+        idb.driver.set_script_timeout(previous_timeout)
+    if not result or not result.get('ok'):
+        print(f"IndexedDB operation failed: {result.get('error') if result else result}")
+        return False
+    return True
 
-            // Create indicator element
-            var indicator = document.createElement('div');
-            indicator.id = 'clear-complete-indicator';
-            indicator.style.display = 'none';
-            document.body.appendChild(indicator);
+def batch_idb_ops(idb: IndexedDB, ops):
+    """
+    Runs several object store operations in a single readwrite transaction, so they are
+    committed together and only pay for one transaction.
+    :param idb: IndexedDB to run the operations in
+    :param ops: List of operations, each {'type': 'clear', 'store': name} or
+                {'type': 'delete', 'store': name, 'key': key}
+    :return: true once the transaction has completed, false otherwise
+    """
+    return _run_object_store_script(idb,
+        """
+            var [ dbName, dbVersion, ops] = [ arguments[0], arguments[1], arguments[2]];
+            var done = arguments[arguments.length - 1];
 
             var request = window.indexedDB.open(dbName, dbVersion);
 
             request.onerror = function(event) {
                 console.error("Error opening IndexedDB: " + dbName, event);
+                done({ok: false, error: "Error opening IndexedDB: " + dbName});
             }
 
             request.onsuccess = function(event) {
                 var db = event.target.result;
-                var objectStore = db.transaction(objectStoreName, 'readwrite').objectStore(objectStoreName);
-
-                const objectStoreRequest = objectStore.clear();
-
-                objectStoreRequest.onerror = function(event) {
-                    console.error("Error clearing object store: " + objectStoreName, event);
+                try {
+                    var storeNames = Array.from(new Set(ops.map(function(op) { return op.store; })));
+                    var transaction = db.transaction(storeNames, 'readwrite');
+
+                    ops.forEach(function(op) {
+                        var objectStore = transaction.objectStore(op.store);
+                        if (op.type === 'clear') {
+                            console.log("Clearing object store: " + op.store);
+                            objectStore.clear();
+                        } else {
+                            console.log("Removing item from object store: " + op.store + " with key: " + op.key);
+                            objectStore.delete(op.key);
+                        }
+                    });
+
+                    // A failed request aborts the whole transaction
+                    transaction.onabort = function(event) {
+                        console.error("IndexedDB transaction aborted", transaction.error);
+                        db.close();
+                        done({ok: false, error: "IndexedDB transaction aborted: " + transaction.error});
+                    }
+
+                    // Report back once every change has been committed
+                    transaction.oncomplete = function(event) {
+                        console.log("IndexedDB operations committed: " + ops.length);
+                        db.close();
+                        done({ok: true});
+                    };
+                } catch (e) {
+                    db.close();
+                    done({ok: false, error: String(e)});
                 }
-
-                objectStoreRequest.onsuccess = function(event) {
-                    console.log("Object store cleared: " + objectStoreName);
-                    db.commit;
-                    // Set indicator when complete
-                    indicator.setAttribute('data-complete', 'true');
-                };
-
             };
         """,
-        idb.db_name,
-        idb.db_version,
-        object_store_name
+        ops
     )
 
+def clear_object_store(idb: IndexedDB, object_store_name):
+    """
+    Clears an IndexedDB object store.
+    :param idb: IndexedDB to clear the object store in
+    :param object_store_name: Name of the object store
+    :return: true once the transaction has completed, false otherwise
+    """
+    return batch_idb_ops(idb, [{'type': 'clear', 'store': object_store_name}])
+
 def custom_remove_item(idb: IndexedDB, object_store_name, key):
     """
     A custom function to remove an item from an IndexedDB object store.
-    Sets a custom attribute on the document to indicate completion.
-    :param idb:
-    :param object_store_name:
-    :param key:
-    :return:
+    :param idb: IndexedDB to remove the item from
+    :param object_store_name: Name of the object store
+    :param key: Key of the item to remove
+    :return: true once the transaction has completed, false otherwise
     """
-    idb.driver.execute_script(
-        """
-            console.log("Removing item from object store: " + arguments[2] + " with key: " + arguments[3]);
-            var [ dbName, dbVersion, objectStoreName, key] = [ arguments[0], arguments[1], arguments[2], arguments[3]];
-
-            // Create indicator element
-            var indicator = document.createElement('div');
-            indicator.id = 'clear-complete-indicator';
-            indicator.style.display = 'none';
-            document.body.appendChild(indicator);
-
-            var request = window.indexedDB.open(dbName, dbVersion);
-
-            request.onerror = function(event) {
-                console.error("Error opening IndexedDB: " + dbName, event);
-            }
-
-            request.onsuccess = function(event) {
-                var db = event.target.result;
-                var objectStore = db.transaction(objectStoreName, 'readwrite').objectStore(objectStoreName);
+    return batch_idb_ops(idb, [{'type': 'delete', 'store': object_store_name, 'key': key}])
 
-                const objectStoreRequest = objectStore.delete(key);
 
-                objectStoreRequest.onerror = function(event) {
-                    console.error("Error removing item from object store: " + objectStoreName, event);
-                }
-
-                objectStoreRequest.onsuccess = function(event) {
-                    console.log("Item removed from object store: " + objectStoreName + " with key: " + key);
-                    db.commit;
-                    // Set indicator when complete
-                    indicator.setAttribute('data-complete', 'true');
-                };
-
-            };
-        """,
-        idb.db_name,
-        idb.db_version,
-        object_store_name,
-        key
-    )
-
-
-def setup_chrome_driver(user_data_dir=None, profile_directory=None):
+def setup_chrome_driver(user_data_dir=None, profile_directory=None, browser_logging=False):
     """
     Set up the Chrome driver with custom profile paths.
 
@@ -122,22 +166,24 @@ def setup_chrome_driver(user_data_dir=None, profile_directory=None):
         user_data_dir (str, optional): Path to the user data directory.
                                       Defaults to C:\\ProgramData\\Physio-Control\\MobileTouch.
         profile_directory (str, optional): Profile directory name. Defaults to AppData.
+        browser_logging (bool, optional): Whether to collect the browser console log for driver.get_log("browser").
+                                          Needed by seletools' IndexedDB getters, which read their results from it.
+                                          Defaults to False.
 
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver instance
     """
     chrome_options = Options()
     chrome_options.add_argument("--headless=new")
+    for argument in _chrome_startup_arguments:
+        chrome_options.add_argument(argument)
 
     logging.info("Current working directory: %s", os.getcwd())
 
     # Set the Chrome binary location
-
-    path_to_chrome = os.path.abspath(os.path.join(os.path.dirname(__file__), 'chrome-win32', 'chrome.exe'))
-    path_to_chrome_driver = os.path.abspath(os.path.join(os.path.dirname(__file__), 'chromedriver.exe'))
-
-    chrome_options.binary_location = path_to_chrome
-    service = Service(executable_path=path_to_chrome_driver)
+    chrome_options.binary_location = _chrome_binary_path
+    # A Service owns the chromedriver process, so each driver gets its own
+    service = Service(executable_path=_chrome_driver_path)
 
     # Set the user data directory and profile
     if user_data_dir:
@@ -150,12 +196,81 @@ def setup_chrome_driver(user_data_dir=None, profile_directory=None):
     else:
         chrome_options.add_argument("profile-directory=AppData")
 
-    # Required for IndexedDB access
-    chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    # Collecting the console log streams every message back to the driver, so only do it when it will be read
+    chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL" if browser_logging else "OFF"})
 
     return webdriver.Chrome(service=service, options=chrome_options)
 
 
+def _use_chrome_driver(driver=None, user_data_dir=None):
+    """
+    Returns a context manager for a Chrome driver: the given driver, which is left running for the
+    caller to reuse, or a new one from setup_chrome_driver that is quit on exit.
+
+    Args:
+        driver (webdriver.Chrome, optional): An already running driver to reuse
+        user_data_dir (str, optional): User data directory for a new driver
+
+    Returns:
+        A context manager that yields the driver
+    """
+    if driver is not None:
+        return contextlib.nullcontext(driver)
+    return setup_chrome_driver(user_data_dir)
+
+
+def _drain_alerts(driver, first_alert_timeout, quiet_period=1, poll_interval=0.05):
+    """
+    Accepts alerts until none has appeared for quiet_period seconds.
+    Waits up to first_alert_timeout seconds for the first alert, since MobileTouch may raise one while it's
+    still starting up. Checks for an alert directly every poll_interval seconds rather than through a
+    WebDriverWait, so the loop ends as soon as the quiet period has passed.
+
+    Args:
+        driver (webdriver.Chrome): The driver showing MobileTouch
+        first_alert_timeout (float): How long to wait for the first alert in seconds
+        quiet_period (float): How long to wait for another alert after one was accepted in seconds
+        poll_interval (float): Time between checks for an alert in seconds
+
+    Returns:
+        int: Number of alerts accepted
+    """
+    accepted = 0
+    deadline = time.monotonic() + first_alert_timeout
+    while time.monotonic() < deadline:
+        try:
+            alert = driver.switch_to.alert
+            print(f"Alert found: {alert.text}")
+            alert.accept()
+            accepted += 1
+            deadline = time.monotonic() + quiet_period
+        except NoAlertPresentException:
+            time.sleep(poll_interval)
+    print(f"No new alerts for {quiet_period if accepted else first_alert_timeout} seconds, continuing...")
+    return accepted
+
+
+def _rmtree_concurrently(path, max_workers=8):
+    """
+    Removes a directory tree like shutil.rmtree, but deletes its top-level children in parallel.
+    Deleting a Chrome profile is mostly waiting on the file system for thousands of small files,
+    so independent subtrees overlap well.
+    Raises the first error encountered, after every child has been attempted.
+
+    :param path: Directory to remove
+    :param max_workers: Maximum number of children deleted at once
+    """
+    with os.scandir(path) as entries:
+        children = [(entry.path, entry.is_dir(follow_symlinks=False)) for entry in entries]
+
+    if children:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(children))) as executor:
+            futures = [executor.submit(rmtree if is_dir else os.remove, child) for child, is_dir in children]
+        for future in futures:
+            future.result()
+
+    os.rmdir(path)
+
 
 def hard_clear(path=standard_path, max_retries=3, retry_delay=1):
     """
@@ -174,7 +289,7 @@ def hard_clear(path=standard_path, max_retries=3, retry_delay=1):
             if os.path.exists(path):
                 if attempt > 0:
                     print(f"Retry attempt {attempt}/{max_retries} to remove directory: {path}")
-                rmtree(path)
+                _rmtree_concurrently(path)
                 print(f"Removed directory and contents: {path}")
                 return True
             else:
@@ -201,48 +316,28 @@ def hard_clear(path=standard_path, max_retries=3, retry_delay=1):
 
 
 
-def delete_deviceinfo_entry(mobiletouch_dir="C:\\ProgramData\\Physio-Control\\MobileTouch"):
-    with setup_chrome_driver(mobiletouch_dir) as driver:
+def delete_deviceinfo_entry(mobiletouch_dir="C:\\ProgramData\\Physio-Control\\MobileTouch", driver=None):
+    """
+    Removes the deviceinfo entry from MobileTouch's IndexedDB.
+    :param mobiletouch_dir: Path to the MobileTouch directory, used when starting a new driver
+    :param driver: An already running driver to reuse instead of starting Chrome; it is not quit
+    :return: true if the entry was removed, false otherwise
+    """
+    with _use_chrome_driver(driver, mobiletouch_dir) as driver:
         try:
             # Navigate to a URL
             driver.get("https://mobiletouch.healthems.com")
 
             idb = IndexedDB(driver, "mobiletouch", 9)
 
-            # Keep checking for alerts until none found for 5 seconds
-            last_alert_time = time.time()
-            wait_time = 15  # Initial wait time of 10 seconds
-            while True:
-                try:
-                    alert = WebDriverWait(driver, wait_time).until(EC.alert_is_present())
-                    print(f"Alert found: {alert.text}")
-                    alert.accept()
-                    wait_time = max(1, min(wait_time - 1, 5))  # Decrease wait time, but keep between 1-5 seconds
-                    last_alert_time = time.time()
-                except:
-                    # If no alert found for 5 seconds, break the loop
-                    if time.time() - last_alert_time > 1:
-                        print("No new alerts for 5 seconds, continuing...")
-                        break
+            # Keep accepting alerts until none found for a second
+            _drain_alerts(driver, first_alert_timeout=15)
 
             object_store_name = "device"
-            custom_remove_item(idb, object_store_name, "deviceinfo")
-
-            # Wait for object store to be cleared
-            try:
-                WebDriverWait(driver, 30).until(
-                    lambda d: print("Checking data-complete attribute...") or d.find_element('id',
-                                                                                             'clear-complete-indicator').get_attribute(
-                        'data-complete') == 'true'
-                )
-                print("deviceinfo entry cleared successfully")
-                return True
-            except Exception as e:
-                print(f"Timeout waiting for object store to clear: {e}")
+            if not custom_remove_item(idb, object_store_name, "deviceinfo"):
                 return False
-            finally:
-                # Remove the indicator element
-                driver.execute_script("document.getElementById('clear-complete-indicator').remove();")
+            print("deviceinfo entry cleared successfully")
+            return True
 
         except Exception as e:
             print(f"An error occurred: {e}", file=sys.stderr)
@@ -250,78 +345,69 @@ def delete_deviceinfo_entry(mobiletouch_dir="C:\\ProgramData\\Physio-Control\\Mo
 
 
 def clear_cookies_and_service_worker(path=standard_path):
-    network_dir = os.path.join(path, "AppData", "Network")
-    service_worker_dir = os.path.join(path, "AppData", "Service Worker")
+    appdata_dir = os.path.join(path, "AppData")
+    # Nothing to do after hard_clear has removed the whole profile
+    if not os.path.exists(appdata_dir):
+        print(f"Profile directory does not exist, nothing to clear: {appdata_dir}")
+        return True
 
-    try:
-        if os.path.exists(network_dir):
-            rmtree(network_dir)
-            print(f"Removed directory and contents: {network_dir}")
-        else:
-            print(f"Network directory does not exist: {network_dir}")
+    network_dir = os.path.join(appdata_dir, "Network")
+    service_worker_dir = os.path.join(appdata_dir, "Service Worker")
 
-        if os.path.exists(service_worker_dir):
-            rmtree(service_worker_dir)
-            print(f"Removed directory and contents: {service_worker_dir}")
+    targets = []
+    for name, directory in (("Network", network_dir), ("Service Worker", service_worker_dir)):
+        if os.path.exists(directory):
+            targets.append(directory)
         else:
-            print(f"Service Worker directory does not exist: {service_worker_dir}")
+            print(f"{name} directory does not exist: {directory}")
+    if not targets:
         return True
-    except PermissionError as e:
-        print(f"Permission error while removing directories: {e}", file=sys.stderr)
-        return False
-    except Exception as e:
-        print(f"An error occurred while clearing cookies and service worker: {e}", file=sys.stderr)
-        return False
+
+    # The two trees are independent and deleting them is mostly waiting on the file system,
+    # so they are removed concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = {directory: executor.submit(rmtree, directory) for directory in targets}
+
+    success = True
+    for directory, future in futures.items():
+        e = future.exception()
+        if e is None:
+            print(f"Removed directory and contents: {directory}")
+        elif isinstance(e, PermissionError):
+            print(f"Permission error while removing directories: {e}", file=sys.stderr)
+            success = False
+        else:
+            print(f"An error occurred while clearing cookies and service worker: {e}", file=sys.stderr)
+            success = False
+    return success
 
 
-def deleteRefTableStore(mobiletouch_dir="C:\\ProgramData\\Physio-Control\\MobileTouch"):
-    with setup_chrome_driver(mobiletouch_dir) as driver:
+def deleteRefTableStore(mobiletouch_dir="C:\\ProgramData\\Physio-Control\\MobileTouch", driver=None):
+    """
+    Clears the reftables object store in MobileTouch's IndexedDB.
+    :param mobiletouch_dir: Path to the MobileTouch directory, used when starting a new driver
+    :param driver: An already running driver to reuse instead of starting Chrome; it is not quit
+    """
+    with _use_chrome_driver(driver, mobiletouch_dir) as driver:
         try:
             # Navigate to a URL
             driver.get("https://mobiletouch.healthems.com")
 
             idb = IndexedDB(driver, "mobiletouch", 9)
 
-            # Keep checking for alerts until none found for 5 seconds
-            last_alert_time = time.time()
-
-            wait_time = 10  # Initial wait time of 10 seconds
-            while True:
-                try:
-                    alert = WebDriverWait(driver, wait_time).until(EC.alert_is_present())
-                    print(f"Alert found: {alert.text}")
-                    alert.accept()
-                    wait_time = max(1, min(wait_time - 1, 5))  # Decrease wait time, but keep between 1-5 seconds
-                    last_alert_time = time.time()
-                except:
-                    # If no alert found for 5 seconds, break the loop
-                    if time.time() - last_alert_time > 1:
-                        print("No new alerts for 5 seconds, continuing...")
-                        break
+            # Keep accepting alerts until none found for a second
+            _drain_alerts(driver, first_alert_timeout=10)
 
             # attempt to clear the object store
             object_store_name = "reftables"
             print(f"Clearing object store: {object_store_name}")
-            clear_object_store(idb, object_store_name)
-
-            # Wait for object store to be cleared
-            try:
-                WebDriverWait(driver, 30).until(
-                    lambda d: print("Checking data-complete attribute...") or d.find_element('id',
-                                                                                             'clear-complete-indicator').get_attribute(
-                        'data-complete') == 'true'
-                )
+            if clear_object_store(idb, object_store_name):
                 print("Object store cleared successfully")
-            except Exception as e:
-                print(f"Timeout waiting for object store to clear: {e}")
-            finally:
-                # Remove the indicator element
-                driver.execute_script("document.getElementById('clear-complete-indicator').remove();")
 
         except Exception as e:
             print(f"An error occurred: {e}", file=sys.stderr)
         finally:
-            # The WebDriver will automatically quit when exiting the 'with' block
+            # A driver started here will automatically quit when exiting the 'with' block
             pass
 
 
@@ -334,19 +420,57 @@ def enumerate_processes():
     for proc in psutil.process_iter(['pid', 'name']):
         print(f"Process ID: {proc.info['pid']}, Name: {proc.info['name']}")
 
-def seek_mobiletouch_process():
+def _iter_mobiletouch_procs():
     """
-    Searches for the MobileTouch process and returns its PID if found.
+    Returns the running MobileTouch processes.
+    Walking the process table opens every process on Windows, so one scan is reused for
+    _PROCESS_SNAPSHOT_TTL seconds to cover back-to-back calls (e.g. killing MobileTouch and then
+    finding its executable). Only pid and name are read during the scan; callers that need the
+    executable path call proc.exe() on the matches.
+    :return: list of psutil.Process objects with "MobileTouch" in their name
+    """
+    global _mobiletouch_processes
+
+    taken_at, processes = _mobiletouch_processes
+    now = time.monotonic()
+    if taken_at is not None and now - taken_at < _PROCESS_SNAPSHOT_TTL:
+        return processes
+
+    processes = [proc for proc in psutil.process_iter(['pid', 'name'])
+                 if proc.info['name'] and "MobileTouch" in proc.info['name']]
+    _mobiletouch_processes = (now, processes)
+    return processes
+
+
+def _forget_mobiletouch_procs():
+    """
+    Discards the process snapshot, after MobileTouch has been started or stopped.
+    """
+    global _mobiletouch_processes
+    _mobiletouch_processes = (None, [])
+
+
+def _seek_mobiletouch_proc():
+    """
+    Searches for the MobileTouch process and returns it if found.
+    :return: psutil.Process from the process scan, or None
     """
     print("Attempting to find MobileTouch process...")
-    for proc in psutil.process_iter(['pid', 'name']):
-        if "MobileTouch" in proc.info['name']:
-            print(f"Found MobileTouch process: {proc.info['name']} (PID: {proc.info['pid']})")
-            return proc.info['pid']
+    for proc in _iter_mobiletouch_procs():
+        print(f"Found MobileTouch process: {proc.info['name']} (PID: {proc.info['pid']})")
+        return proc
     print("MobileTouch is not running.")
     return None
 
 
+def seek_mobiletouch_process():
+    """
+    Searches for the MobileTouch process and returns its PID if found.
+    """
+    proc = _seek_mobiletouch_proc()
+    return proc.info['pid'] if proc is not None else None
+
+
 def kill_mobiletouch_process():
     """
     Kills the MobileTouch process if it is running.
@@ -355,11 +479,11 @@ def kill_mobiletouch_process():
     global _mobiletouch_executable_path
 
     print("Attempting to kill MobileTouch process...")
-    pid = seek_mobiletouch_process()
-    if pid:
+    # use the Process object from the scan rather than opening the process again by PID
+    proc = _seek_mobiletouch_proc()
+    if proc is not None:
+        pid = proc.info['pid']
         try:
-            proc = psutil.Process(pid)
-
             # Save the executable path before terminating the process
             try:
                 exe_path = proc.exe()
@@ -375,6 +499,8 @@ def kill_mobiletouch_process():
             print(f"No process found with PID: {pid}")
         except Exception as e:
             print(f"Error terminating process: {e}")
+        finally:
+            _forget_mobiletouch_procs()
 
 
 def validate_mobiletouch(driver=None):
@@ -399,9 +525,15 @@ def validate_mobiletouch(driver=None):
 
         print("Waiting for MobileTouch to load...")
         # wait until id "username" and id "password" are present or an alert is detected, or a button with the text "Configure this Device" is present
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "/html/body/div/div/span/div/div/div/div[2]/div/button")) or
-            (EC.presence_of_element_located((By.XPATH, "//*[@id=\"username\"]")) and EC.presence_of_element_located((By.XPATH, "//*[@id=\"password\"]")))
+        # Conditions have to be combined with any_of/all_of; combining them with 'or'/'and' only ever waited for the button
+        WebDriverWait(driver, 10, poll_frequency=0.25).until(
+            EC.any_of(
+                EC.presence_of_element_located((By.XPATH, "/html/body/div/div/span/div/div/div/div[2]/div/button")),
+                EC.all_of(
+                    EC.presence_of_element_located((By.XPATH, "//*[@id=\"username\"]")),
+                    EC.presence_of_element_located((By.XPATH, "//*[@id=\"password\"]"))
+                )
+            )
         )
         print("MobileTouch seems accessible.")
         return True
@@ -419,21 +551,45 @@ def validate_mobiletouch(driver=None):
 def find_mobiletouch_executable():
     """
     Finds the MobileTouch executable path by:
-    1. Using the saved path from a previously killed process
+    1. Using the saved path from a previously killed process or an earlier search
     2. Checking common installation locations
     3. Checking the Windows registry
     4. Getting the path from process information if it is currently running
+    A found path is saved for later calls. If the search fails, it isn't repeated for
+    _FAILED_EXECUTABLE_SEARCH_TTL seconds.
 
     Returns:
         str: Path to the MobileTouch executable if found, None otherwise
     """
-    global _mobiletouch_executable_path
+    global _mobiletouch_executable_path, _last_failed_executable_search
 
     # First check if we have a saved path from a previously killed process
     if _mobiletouch_executable_path and os.path.exists(_mobiletouch_executable_path):
         print(f"Using saved MobileTouch executable path: {_mobiletouch_executable_path}")
         return _mobiletouch_executable_path
 
+    if (_last_failed_executable_search is not None and
+            time.monotonic() - _last_failed_executable_search < _FAILED_EXECUTABLE_SEARCH_TTL):
+        print("Could not find MobileTouch executable in the last search, not searching again yet.")
+        return None
+
+    exe_path = _search_mobiletouch_executable()
+    if exe_path:
+        _mobiletouch_executable_path = exe_path
+        _last_failed_executable_search = None
+    else:
+        _last_failed_executable_search = time.monotonic()
+    return exe_path
+
+
+def _search_mobiletouch_executable():
+    """
+    Searches the common installation locations, the Windows registry and the running processes
+    for the MobileTouch executable, for find_mobiletouch_executable.
+
+    Returns:
+        str: Path to the MobileTouch executable if found, None otherwise
+    """
     # Common installation locations
     common_locations = [
         r"C:\Program Files (x86)\Sansio Inc\MobileTouch\MobileTouch.exe",
@@ -453,14 +609,14 @@ def find_mobiletouch_executable():
         # Try different registry paths that might contain MobileTouch installation info
         registry_paths = [
             (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Sansio Inc\MobileTouch"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Physio-Control\MobileTouch"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Sansio Inc\MobileTouch"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Physio-Control\MobileTouch")
+            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Physio-Control\MobileTouch")
         ]
+        # Check the 64-bit registry view, then the 32-bit one (WOW6432Node), whatever the bitness of this process
+        registry_views = [winreg.KEY_WOW64_64KEY, winreg.KEY_WOW64_32KEY]
 
-        for hkey, path in registry_paths:
+        for view, (hkey, path) in itertools.product(registry_views, registry_paths):
             try:
-                with winreg.OpenKey(hkey, path) as key:
+                with winreg.OpenKey(hkey, path, 0, winreg.KEY_READ | view) as key:
                     install_path, _ = winreg.QueryValueEx(key, "InstallPath")
                     exe_path = os.path.join(install_path, "MobileTouch.exe")
                     if os.path.exists(exe_path):
@@ -476,13 +632,13 @@ def find_mobiletouch_executable():
 
     # Try to get the path from process information
     print("Checking for running MobileTouch process...")
-    for proc in psutil.process_iter(['pid', 'name', 'exe']):
+    for proc in _iter_mobiletouch_procs():
         try:
-            if "MobileTouch" in proc.info['name']:
-                exe_path = proc.info['exe']
-                if exe_path and os.path.exists(exe_path):
-                    print(f"Found MobileTouch executable from process: {exe_path}")
-                    return exe_path
+            # exe is expensive to query, so it is only read for MobileTouch processes
+            exe_path = proc.exe()
+            if exe_path and os.path.exists(exe_path):
+                print(f"Found MobileTouch executable from process: {exe_path}")
+                return exe_path
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             continue
 
@@ -507,19 +663,22 @@ def start_mobiletouch(wait_for_startup=False):
 
     try:
         print(f"Starting MobileTouch from: {exe_path}")
-        process = subprocess.Popen([exe_path])
+        # Detach MobileTouch from this process's console and handles, so it keeps running independently of the service
+        process = subprocess.Popen([exe_path],
+                                   creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   close_fds=True)
+        _forget_mobiletouch_procs()
 
         if wait_for_startup:
-            # Wait for a short time to allow the process to start
-            time.sleep(5)
-
-            # Check if the process is still running
-            if process.poll() is None:
+            # Give the process a short time to start, returning early if it exits in the meantime
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
                 print("MobileTouch started successfully.")
                 return True
-            else:
-                print(f"MobileTouch process exited with code: {process.returncode}")
-                return False
+            print(f"MobileTouch process exited with code: {process.returncode}")
+            return False
 
         print("MobileTouch start initiated.")
         return True
@@ -166,7 +166,7 @@ def _with_archive(archive_name):
         logger.info(f"Found MobileTouch directory: {mobiletouch_dir}")
 
         # Set up Chrome driver with the extracted profile
-        driver = setup_chrome_driver(user_data_dir=str(mobiletouch_dir))
+        driver = setup_chrome_driver(user_data_dir=str(mobiletouch_dir), browser_logging=True)
 
         try:
             # Navigate to MobileTouch URL
@@ -633,7 +633,7 @@ def _with_archive_parse_real_logs(archive_name):
 
         # Set up Chrome driver with the extracted profile
         logger.info("Setting up Chrome driver...")
-        driver = setup_chrome_driver(user_data_dir=str(mobiletouch_dir), profile_directory="AppData")
+        driver = setup_chrome_driver(user_data_dir=str(mobiletouch_dir), profile_directory="AppData", browser_logging=True)
 
         try:
             # Navigate to MobileTouch URL
@@ -880,7 +880,7 @@ def _with_archive_repair_from_callbacks(archive_name):
 
         # Set up Chrome driver with the extracted profile
         logger.info("Setting up Chrome driver...")
-        driver = setup_chrome_driver(user_data_dir=str(mobiletouch_dir), profile_directory="AppData")
+        driver = setup_chrome_driver(user_data_dir=str(mobiletouch_dir), profile_directory="AppData", browser_logging=True)
 
         try:
             # Navigate to MobileTouch URL
@@ -0,0 +1,183 @@
+import datetime
+import logging
+import os
+import sys
+
+import pytest
+
+from mobile_touch_log_parsing import (TriggerString, LogEntry, LogLevel, LogBatch, check_trigger_strings,
+                                      complete_lines_end, iter_lines_reverse, parse_log, parse_log_bulk, parse_log_parallel,
+                                      read_new_entries, recent_log_files)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout),
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Every trigger string that can actually appear in a log
+TRIGGERS = [trigger for trigger in TriggerString if trigger is not TriggerString.UNKNOWN]
+
+
+def log_line(timestamp: datetime.datetime, message: str, level: str = "INFO") -> str:
+    """Formats a log line the way MobileTouch writes it, without the line ending."""
+    return f"{timestamp:%Y-%m-%d %H:%M:%S},{timestamp.microsecond // 1000:03d} {level} {message}"
+
+
+@pytest.fixture
+def no_callbacks(monkeypatch):
+    """Fixture to unregister all trigger callbacks for the duration of a test."""
+    for trigger in TriggerString:
+        monkeypatch.setattr(trigger, "callback", None)
+
+
+@pytest.mark.parametrize("trigger", TRIGGERS, ids=lambda x: x.name)
+def test_from_message_matches_trigger_value(trigger):
+    """Test that from_message finds a trigger string embedded in a log message."""
+    message = f"[Console] [SEVERE] {trigger.value} (see stack trace)"
+    assert TriggerString.from_message(message) is trigger
+
+
+@pytest.mark.parametrize("trigger", TRIGGERS, ids=lambda x: x.name)
+def test_from_message_ignores_trigger_name(trigger):
+    """Test that the enum member name is not mistaken for the trigger string."""
+    assert TriggerString.from_message(f"Nothing to see here: {trigger.name}") is TriggerString.UNKNOWN
+
+
+@pytest.mark.parametrize("message", [f"prefix {trigger.value} suffix" for trigger in TRIGGERS] +
+                         ["No trigger in this message", "UNKNOWN"])
+def test_check_trigger_strings_agrees_with_from_message(no_callbacks, message):
+    """Test that check_trigger_strings detects exactly the messages from_message recognizes."""
+    entry = LogEntry.from_parts(datetime.datetime.now(), LogLevel.ERROR, message)
+    expected = TriggerString.from_message(message) is not TriggerString.UNKNOWN
+    assert check_trigger_strings(entry) == expected
+
+
+@pytest.fixture
+def large_log(tmp_path):
+    """Fixture for a log file over a megabyte, made of equal-length lines so ranges can end on line starts."""
+    log_path = tmp_path / "mobiletouch.log"
+    start = datetime.datetime(2025, 5, 26, 9, 0, 0)
+    with log_path.open("w", newline="\n") as file:
+        for i in range(40000):
+            file.write(log_line(start + datetime.timedelta(milliseconds=i), f"msg number {i:06d}") + "\n")
+    return log_path
+
+
+@pytest.mark.parametrize("workers", [2, 3, 4, 8])
+def test_parse_log_parallel_matches_bulk(large_log, workers):
+    """Test that splitting the file into ranges neither drops nor duplicates entries at range boundaries."""
+    expected = [entry.message for entry in parse_log_bulk(large_log)]
+    assert len(expected) == 40000
+    assert [entry.message for entry in parse_log_parallel(large_log, workers)] == expected
+
+
+def test_iter_lines_reverse_across_blocks(tmp_path):
+    """Test that lines split across small blocks are rejoined, CRLF endings stripped and blank lines skipped."""
+    log_path = tmp_path / "mobiletouch.log"
+    lines = [f"line {i}:" + "x" * i for i in range(20)]
+    log_path.write_bytes(("\r\n".join(lines[:10]) + "\r\n\r\n" + "\r\n".join(lines[10:]) + "\r\n").encode())
+    assert list(iter_lines_reverse(log_path, block_size=7)) == lines[::-1]
+
+
+def test_read_new_entries_leaves_partial_line(tmp_path):
+    """Test that a partially written last line is only consumed once it is complete."""
+    log_path = tmp_path / "mobiletouch.log"
+    start = datetime.datetime(2025, 5, 26, 9, 0, 0)
+    complete = log_line(start, "first") + "\n" + log_line(start, "second") + "\n"
+    log_path.write_bytes((complete + log_line(start, "thi")).encode())
+
+    entries, offset = read_new_entries(log_path, 0)
+    assert [entry.message for entry in entries] == ["first", "second"]
+    assert offset == len(complete)
+
+    with log_path.open("ab") as file:
+        file.write(b"rd\n")
+    entries, offset = read_new_entries(log_path, offset)
+    assert [entry.message for entry in entries] == ["third"]
+    assert offset == log_path.stat().st_size
+
+
+@pytest.mark.parametrize("block_size", [5, 65536])
+def test_tailing_starts_before_partial_line(tmp_path, block_size):
+    """Test that a line still being written when tailing starts is read once it is complete."""
+    log_path = tmp_path / "mobiletouch.log"
+    start = datetime.datetime(2025, 5, 26, 9, 0, 0)
+    complete = log_line(start, "already there") + "\n"
+    trigger_line = log_line(start, TRIGGERS[0].value, "ERROR")
+    log_path.write_bytes((complete + trigger_line[:30]).encode())
+
+    offset = complete_lines_end(log_path, block_size=block_size)
+    assert offset == len(complete)
+
+    with log_path.open("ab") as file:
+        file.write((trigger_line[30:] + "\n").encode())
+    entries, offset = read_new_entries(log_path, offset, only_triggers=True)
+    assert [entry.message for entry in entries] == [TRIGGERS[0].value]
+    assert offset == log_path.stat().st_size
+
+
+def test_complete_lines_end_without_newline(tmp_path):
+    """Test that a file without any complete line is tailed from the start."""
+    log_path = tmp_path / "mobiletouch.log"
+    log_path.write_bytes(b"2025-05-26 09:00")
+    assert complete_lines_end(log_path, block_size=4) == 0
+
+
+def test_read_new_entries_after_truncation(tmp_path):
+    """Test that a file smaller than the offset is read again from the start."""
+    log_path = tmp_path / "mobiletouch.log"
+    log_path.write_bytes((log_line(datetime.datetime(2025, 5, 26, 9, 0, 0), "after rotation") + "\n").encode())
+    entries, offset = read_new_entries(log_path, 10_000)
+    assert [entry.message for entry in entries] == ["after rotation"]
+    assert offset == log_path.stat().st_size
+
+
+def test_read_new_entries_only_triggers(tmp_path):
+    """Test that only trigger lines are returned, and a line with two triggers only once."""
+    log_path = tmp_path / "mobiletouch.log"
+    start = datetime.datetime(2025, 5, 26, 9, 0, 0)
+    both = f"{TRIGGERS[0].value} and {TRIGGERS[1].value}"
+    lines = [log_line(start, "no trigger here"), log_line(start, both, "ERROR"),
+             "    at a stack trace line", log_line(start, TRIGGERS[2].value, "ERROR")]
+    log_path.write_bytes(("\n".join(lines) + "\n").encode())
+
+    entries, offset = read_new_entries(log_path, 0, only_triggers=True)
+    assert [entry.message for entry in entries] == [both, TRIGGERS[2].value]
+    assert offset == log_path.stat().st_size
+
+
+def test_parse_log_reads_rotated_file_up_to_cutoff(tmp_path):
+    """Test that parse_log continues into mobiletouch.log.1, stops at the cutoff and skips files modified before it."""
+    log_path = tmp_path / "mobiletouch.log"
+    now = datetime.datetime(2025, 5, 26, 12, 0, 0)
+    # entries every 20 minutes, the last three in the current file and the rest in the rotated one
+    timestamps = [now - datetime.timedelta(minutes=20 * i) for i in range(12, 0, -1)]
+    (tmp_path / "mobiletouch.log.1").write_text("\n".join(log_line(t, f"at {t:%H:%M}") for t in timestamps[:-3]) + "\n")
+    log_path.write_text("\n".join(log_line(t, f"at {t:%H:%M}") for t in timestamps[-3:]) + "\n")
+    stale_path = tmp_path / "mobiletouch.log.2"
+    stale_path.write_text(log_line(now, "stale") + "\n")
+    stale_time = (now - datetime.timedelta(hours=3)).timestamp()
+    os.utime(stale_path, (stale_time, stale_time))
+
+    cutoff_date = now - datetime.timedelta(hours=2)
+    assert recent_log_files(log_path, cutoff_date) == [log_path, tmp_path / "mobiletouch.log.1"]
+    expected = [f"at {t:%H:%M}" for t in reversed(timestamps) if t >= cutoff_date]
+    assert [entry.message for entry in parse_log(log_path, now=now)] == expected
+
+
+def test_parse_log_bulk_cutoff_matches_log_batch_since(tmp_path):
+    """Test that the string-compared cutoff in parse_log_bulk agrees with LogBatch.since."""
+    log_path = tmp_path / "mobiletouch.log"
+    start = datetime.datetime(2025, 5, 26, 9, 0, 0)
+    timestamps = [start + datetime.timedelta(seconds=i, milliseconds=250 * i) for i in range(40)]
+    log_path.write_text("\n".join(log_line(t, f"entry {i}") for i, t in enumerate(timestamps)) + "\n")
+    cutoff_date = timestamps[17]
+
+    since = LogBatch.from_entries(parse_log_bulk(log_path)).since(cutoff_date)
+    assert len(since) == 23
+    assert [entry.message for entry in parse_log_bulk(log_path, cutoff_date)] == since.messages